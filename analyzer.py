@@ -1,7 +1,33 @@
+import functools
 import hashlib
-from typing import Dict
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping
 
-def analyze_string(value: str) -> Dict:
+# Translation table that drops spaces in a single C-level scan
+_SPACE_TBL = str.maketrans('', '', ' ')
+
+def _is_palindrome(cleaned: str) -> bool:
+    """Compare the first half against the reversed second half."""
+    half = len(cleaned) // 2
+    if not half:
+        return True
+    return cleaned[:half] == cleaned[:-half - 1:-1]
+
+def _ends_differ(first: str, last: str) -> bool:
+    """
+    True when the end characters alone prove the string is not a palindrome.
+    
+    Only non-space ASCII characters are compared: their lowercase form does
+    not depend on context, unlike e.g. a final Greek sigma.
+    """
+    return (
+        first != ' ' and last != ' '
+        and first.isascii() and last.isascii()
+        and first.lower() != last.lower()
+    )
+
+def _analyze_string_impl(value: str) -> Dict:
     """
     Analyze a string and compute all required properties.
     
@@ -15,22 +41,24 @@ def analyze_string(value: str) -> Dict:
     length = len(value)
     
     # 2. Is Palindrome (case-insensitive, ignoring spaces)
-    cleaned = value.replace(" ", "").lower()
-    is_palindrome = cleaned == cleaned[::-1]
+    if value and _ends_differ(value[0], value[-1]):
+        # Cheap early-out that skips building the cleaned copy
+        is_palindrome = False
+    else:
+        cleaned = value.translate(_SPACE_TBL).lower()
+        is_palindrome = _is_palindrome(cleaned)
     
-    # 3. Unique Characters
-    unique_characters = len(set(value))
+    # 3. Character Frequency Map
+    character_frequency_map = dict(Counter(value))
     
-    # 4. Word Count (split by whitespace)
-    word_count = len(value.split())
+    # 4. Unique Characters (derived from the frequency map)
+    unique_characters = len(character_frequency_map)
     
-    # 5. SHA-256 Hash
-    sha256_hash = hashlib.sha256(value.encode()).hexdigest()
+    # 5. Word Count (split by whitespace)
+    word_count = len(value.split())
     
-    # 6. Character Frequency Map
-    character_frequency_map = {}
-    for char in value:
-        character_frequency_map[char] = character_frequency_map.get(char, 0) + 1
+    # 6. SHA-256 Hash (used as an identifier, not for security)
+    sha256_hash = hashlib.sha256(value.encode(), usedforsecurity=False).hexdigest()
     
     return {
         "length": length,
@@ -39,4 +67,47 @@ def analyze_string(value: str) -> Dict:
         "word_count": word_count,
         "sha256_hash": sha256_hash,
         "character_frequency_map": character_frequency_map
-    }
\ No newline at end of file
+    }
+
+
+# Analysis is a pure function of the value, so repeated requests for the same
+# string reuse the cached result. Only short values are memoized so the cache
+# cannot pin large inputs in memory.
+_MEMO_MAX_LENGTH = 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_string_cached(value: str) -> Mapping:
+    """Memoized analysis, frozen so the shared result cannot be mutated"""
+    properties = _analyze_string_impl(value)
+    properties["character_frequency_map"] = MappingProxyType(properties["character_frequency_map"])
+    return MappingProxyType(properties)
+
+
+def analyze_string(value: str) -> Mapping:
+    """
+    Analyze a string, reusing cached results for short values.
+    
+    Args:
+        value: The string to analyze
+        
+    Returns:
+        Read-only mapping of computed properties
+    """
+    if len(value) <= _MEMO_MAX_LENGTH:
+        return _analyze_string_cached(value)
+    return MappingProxyType(_analyze_string_impl(value))
+
+
+def analyze_strings(values: Iterable[str]) -> List[Dict]:
+    """
+    Analyze many strings at once, e.g. for bulk ingestion or re-analysis.
+    
+    Args:
+        values: The strings to analyze
+        
+    Returns:
+        List of property dictionaries, in the same order as the input
+    """
+    # Bypass the memo cache so one-off bulk values don't evict hot entries
+    return list(map(_analyze_string_impl, values))
\ No newline at end of file
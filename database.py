@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -18,6 +18,32 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+# Create tables and bring existing databases up to date
+def init_db():
+    """
+    Create missing tables, then apply additive schema changes that
+    create_all does not handle for tables that already exist: new nullable
+    columns and new indexes. Safe to run repeatedly.
+    """
+    Base.metadata.create_all(bind=engine)
+    
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                # Only nullable columns can be added to a populated table
+                if column.name in existing or not column.nullable:
+                    continue
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                ))
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
 # Dependency for FastAPI
 def get_db():
     db = SessionLocal()
@@ -1,23 +1,90 @@
 from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 import os
+import time
+import orjson
 
-from database import engine, get_db, Base
-from models import AnalyzedString
-from schemas import StringInput, StringResponse, StringListResponse, NaturalLanguageResponse
-from analyzer import analyze_string
+from database import DATABASE_URL, engine, get_db, init_db
+from models import AnalyzedString, frequency_columns, row_to_dict
+from schemas import StringInput, StringResponse, StringListResponse, StringBatchResponse, NaturalLanguageResponse
+from analyzer import analyze_string, analyze_strings
 from nlp_parser import parse_natural_language_query, validate_parsed_filters
 
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create or migrate the schema before serving requests"""
+    # Workers started together can race on DDL ("table/index already exists").
+    # init_db is idempotent, so retry until one pass sees the finished schema.
+    for attempt in range(5):
+        try:
+            init_db()
+            break
+        except OperationalError:
+            if attempt == 4:
+                raise
+            time.sleep(0.2)
+    yield
+
 
 app = FastAPI(
     title="String Analyzer Service",
     description="API for analyzing and storing string properties",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Pre-encoded JSON for GET /strings/{string_value}, keyed by string value.
+# Rows never change after insert, so entries only need dropping on delete.
+# The cache is bounded by total encoded size, and large payloads are never cached.
+# Each worker process has its own cache, so hits are revalidated against the
+# row's created_at in case another worker deleted or re-created the string.
+_RESP_CACHE: Dict[str, Tuple[datetime, bytes]] = {}
+_RESP_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_RESP_CACHE_MAX_ENTRY_BYTES = 64 * 1024
+_resp_cache_bytes = 0
+
+
+def _evict_response(value: str) -> None:
+    """Drop a cached response, keeping the byte total in sync"""
+    global _resp_cache_bytes
+    entry = _RESP_CACHE.pop(value, None)
+    if entry is not None:
+        _resp_cache_bytes -= len(entry[1])
+
+
+def _cache_response(value: str, payload: dict) -> bytes:
+    """Encode a string response and store it in the response cache"""
+    global _resp_cache_bytes
+    content = orjson.dumps(payload)
+    if len(content) > _RESP_CACHE_MAX_ENTRY_BYTES:
+        return content
+    _evict_response(value)
+    while _RESP_CACHE and _resp_cache_bytes + len(content) > _RESP_CACHE_MAX_BYTES:
+        # Evict the oldest entry (dicts keep insertion order)
+        _evict_response(next(iter(_RESP_CACHE)))
+    _RESP_CACHE[value] = (payload["created_at"], content)
+    _resp_cache_bytes += len(content)
+    return content
+
+
+def _contains_character(char: str):
+    """Case-sensitive SQL filter for strings containing a character"""
+    if engine.dialect.name == "sqlite":
+        # SQLite's LIKE ignores ASCII case; instr() compares exactly
+        return func.instr(AnalyzedString.value, char) > 0
+    # LIKE is case-sensitive on other backends such as PostgreSQL
+    return AnalyzedString.value.contains(char, autoescape=True)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -35,6 +102,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /strings": "Analyze and store a new string",
+            "POST /strings/batch": "Analyze and store many strings at once",
             "GET /strings/{string_value}": "Get a specific string's analysis",
             "GET /strings": "Get all strings with optional filtering",
             "GET /strings/filter-by-natural-language": "Filter using natural language",
@@ -53,14 +121,6 @@ async def create_string(string_input: StringInput, db: Session = Depends(get_db)
     try:
         value = string_input.value
         
-        # Check if string already exists
-        existing = db.query(AnalyzedString).filter(AnalyzedString.value == value).first()
-        if existing:
-            raise HTTPException(
-                status_code=409,
-                detail="String already exists in the system"
-            )
-        
         properties = analyze_string(value)
         
         db_string = AnalyzedString(
@@ -71,14 +131,86 @@ async def create_string(string_input: StringInput, db: Session = Depends(get_db)
             unique_characters=properties["unique_characters"],
             word_count=properties["word_count"],
             sha256_hash=properties["sha256_hash"],
-            character_frequency_map=properties["character_frequency_map"]
+            **frequency_columns(properties["character_frequency_map"])
         )
         
         db.add(db_string)
-        db.commit()
+        
+        # The unique constraint on value detects duplicates, so no existence probe is needed
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="String already exists in the system"
+            )
+        
         db.refresh(db_string)
         
-        return db_string.to_dict()
+        response = db_string.to_dict()
+        _cache_response(value, response)
+        
+        return response
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.post("/strings/batch", response_model=StringBatchResponse, status_code=201)
+async def create_strings_batch(string_inputs: List[StringInput], db: Session = Depends(get_db)):
+    """
+    Analyze and store many strings in a single transaction.
+    
+    Repeated values within the request are stored once; strings that
+    already exist are skipped and listed in `skipped`. Returns 201 if
+    successful, 409 if a concurrent request inserted one of the strings first.
+    """
+    try:
+        # Deduplicate while keeping request order
+        values = list(dict.fromkeys(s.value for s in string_inputs))
+        
+        existing = set(
+            db.execute(select(AnalyzedString.value).where(AnalyzedString.value.in_(values))).scalars()
+        ) if values else set()
+        new_values = [v for v in values if v not in existing]
+        
+        # Naive UTC, matching what the DateTime column returns on every read
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            {
+                "id": properties["sha256_hash"],
+                "value": value,
+                "length": properties["length"],
+                "is_palindrome": properties["is_palindrome"],
+                "unique_characters": properties["unique_characters"],
+                "word_count": properties["word_count"],
+                "sha256_hash": properties["sha256_hash"],
+                "created_at": created_at,
+                **frequency_columns(properties["character_frequency_map"])
+            }
+            for value, properties in zip(new_values, analyze_strings(new_values))
+        ]
+        
+        if rows:
+            db.bulk_insert_mappings(AnalyzedString, rows)
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                raise HTTPException(
+                    status_code=409,
+                    detail="One or more strings were added concurrently; retry the request"
+                )
+        
+        return {
+            "data": [row_to_dict(r) for r in rows],
+            "count": len(rows),
+            "skipped": [v for v in values if v in existing]
+        }
     
     except HTTPException:
         raise
@@ -94,6 +226,17 @@ async def get_string(string_value: str, db: Session = Depends(get_db)):
     
     Returns 200 if found, 404 if not found.
     """
+    cached = _RESP_CACHE.get(string_value)
+    if cached is not None:
+        # The id is derived from the value, so only created_at tells a
+        # re-created row apart from the one that was cached
+        created_at = db.execute(
+            select(AnalyzedString.created_at).where(AnalyzedString.value == string_value)
+        ).scalar()
+        if created_at == cached[0]:
+            return Response(content=cached[1], media_type="application/json")
+        _evict_response(string_value)
+    
     db_string = db.query(AnalyzedString).filter(AnalyzedString.value == string_value).first()
     
     if not db_string:
@@ -102,7 +245,8 @@ async def get_string(string_value: str, db: Session = Depends(get_db)):
             detail="String does not exist in the system"
         )
     
-    return db_string.to_dict()
+    content = _cache_response(string_value, db_string.to_dict())
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/strings", response_model=StringListResponse)
@@ -112,6 +256,8 @@ async def get_all_strings(
     max_length: Optional[int] = Query(None, ge=0),
     word_count: Optional[int] = Query(None, ge=0),
     contains_character: Optional[str] = Query(None, min_length=1, max_length=1),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db)
 ):
     """
@@ -123,44 +269,45 @@ async def get_all_strings(
     - max_length: Maximum string length
     - word_count: Exact word count
     - contains_character: Single character to search for
+    - limit: Maximum number of strings to return (default 100)
+    - offset: Number of matching strings to skip
     """
     try:
-        query = db.query(AnalyzedString)
+        query = select(*AnalyzedString.__table__.c)
         
         filters_applied = {}
         
         if is_palindrome is not None:
-            query = query.filter(AnalyzedString.is_palindrome == is_palindrome)
+            query = query.where(AnalyzedString.is_palindrome == is_palindrome)
             filters_applied["is_palindrome"] = is_palindrome
         
         if min_length is not None:
-            query = query.filter(AnalyzedString.length >= min_length)
+            query = query.where(AnalyzedString.length >= min_length)
             filters_applied["min_length"] = min_length
         
         if max_length is not None:
-            query = query.filter(AnalyzedString.length <= max_length)
+            query = query.where(AnalyzedString.length <= max_length)
             filters_applied["max_length"] = max_length
         
         if word_count is not None:
-            query = query.filter(AnalyzedString.word_count == word_count)
+            query = query.where(AnalyzedString.word_count == word_count)
             filters_applied["word_count"] = word_count
         
         if contains_character is not None:
-            all_strings = query.all()
-            filtered_strings = [s for s in all_strings if contains_character in s.value]
+            query = query.where(_contains_character(contains_character))
             filters_applied["contains_character"] = contains_character
-            
-            return {
-                "data": [s.to_dict() for s in filtered_strings],
-                "count": len(filtered_strings),
-                "filters_applied": filters_applied
-            }
         
-        results = query.all()
+        total = db.execute(select(func.count()).select_from(query.subquery())).scalar()
+        
+        page = query.order_by(AnalyzedString.created_at, AnalyzedString.id).offset(offset).limit(limit)
+        results = db.execute(page).mappings().all()
         
         return {
-            "data": [s.to_dict() for s in results],
-            "count": len(results),
+            "data": [row_to_dict(r) for r in results],
+            "count": total,
+            "page_size": len(results),
+            "limit": limit,
+            "offset": offset,
             "filters_applied": filters_applied if filters_applied else None
         }
     
@@ -198,33 +345,31 @@ async def filter_by_natural_language(
                 detail=f"Query parsed but resulted in conflicting filters: {validation_error}"
             )
         
-        db_query = db.query(AnalyzedString)
+        db_query = select(*AnalyzedString.__table__.c)
         
         if "is_palindrome" in parsed_filters:
-            db_query = db_query.filter(AnalyzedString.is_palindrome == parsed_filters["is_palindrome"])
+            db_query = db_query.where(AnalyzedString.is_palindrome == parsed_filters["is_palindrome"])
         
         if "min_length" in parsed_filters:
-            db_query = db_query.filter(AnalyzedString.length >= parsed_filters["min_length"])
+            db_query = db_query.where(AnalyzedString.length >= parsed_filters["min_length"])
         
         if "max_length" in parsed_filters:
-            db_query = db_query.filter(AnalyzedString.length <= parsed_filters["max_length"])
+            db_query = db_query.where(AnalyzedString.length <= parsed_filters["max_length"])
         
         if "word_count" in parsed_filters:
-            db_query = db_query.filter(AnalyzedString.word_count == parsed_filters["word_count"])
+            db_query = db_query.where(AnalyzedString.word_count == parsed_filters["word_count"])
         
-        results = db_query.all()
-        
-        # Filter by character if needed
         if "contains_character" in parsed_filters:
-            char = parsed_filters["contains_character"]
-            results = [s for s in results if char in s.value]
+            db_query = db_query.where(_contains_character(parsed_filters["contains_character"]))
+        
+        results = db.execute(db_query).mappings().all()
         
         return {
-            "data": [s.to_dict() for s in results],
+            "data": [row_to_dict(r) for r in results],
             "count": len(results),
             "interpreted_query": {
                 "original": query,
-                "parsed_filters": parsed_filters
+                "parsed_filters": dict(parsed_filters)
             }
         }
     
@@ -251,6 +396,7 @@ async def delete_string(string_value: str, db: Session = Depends(get_db)):
     
     db.delete(db_string)
     db.commit()
+    _evict_response(string_value)
     
     return None
 
@@ -264,4 +410,17 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    dev = bool(int(os.getenv("DEV", "0")))
+    # SQLite allows a single writer, so extra processes only add lock contention
+    default_workers = 1 if DATABASE_URL.startswith("sqlite") else (os.cpu_count() or 1)
+    workers = int(os.getenv("WORKERS", default_workers))
+    # Create the schema once, before any worker starts, so workers never race on DDL
+    init_db()
+    # Reload mode only supports a single process, so workers apply outside dev
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        reload=dev,
+        workers=None if dev else workers
+    )
\ No newline at end of file
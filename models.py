@@ -1,35 +1,70 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, Index, LargeBinary
 from datetime import datetime, timezone
+import struct
 from database import Base
 
+# One (codepoint, count) pair per distinct ASCII character
+_ASCII_FREQ = struct.Struct("<BI")
+
 class AnalyzedString(Base):
     __tablename__ = "analyzed_strings"
+    __table_args__ = (
+        # Serves "palindromic strings longer than X" style filters
+        Index("ix_palin_len", "is_palindrome", "length"),
+        # Serves the stable page ordering of GET /strings
+        Index("ix_created_at_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, index=True)
 
     value = Column(String, nullable=False, unique=True, index=True)
 
-    length = Column(Integer, nullable=False)
+    length = Column(Integer, nullable=False, index=True)
     is_palindrome = Column(Boolean, nullable=False)
     unique_characters = Column(Integer, nullable=False)
-    word_count = Column(Integer, nullable=False)
+    word_count = Column(Integer, nullable=False, index=True)
     sha256_hash = Column(String, nullable=False)
-    character_frequency_map = Column(JSON, nullable=False)
+    # ASCII strings store their frequencies packed in character_frequency_ascii;
+    # the JSON column is only used as a fallback for non-ASCII strings
+    character_frequency_map = Column(JSON, nullable=True)
+    character_frequency_ascii = Column(LargeBinary, nullable=True)
 
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     
     def to_dict(self):
         """Convert model to dictionary for API response"""
-        return {
-            "id": self.id,
-            "value": self.value,
-            "properties": {
-                "length": self.length,
-                "is_palindrome": self.is_palindrome,
-                "unique_characters": self.unique_characters,
-                "word_count": self.word_count,
-                "sha256_hash": self.sha256_hash,
-                "character_frequency_map": self.character_frequency_map
-            },
-            "created_at": self.created_at.isoformat()
-        }
\ No newline at end of file
+        return row_to_dict({column.name: getattr(self, column.name) for column in self.__table__.columns})
+
+
+def frequency_columns(frequency_map):
+    """Build the frequency column values for a character frequency map"""
+    if all(len(char) == 1 and char.isascii() for char in frequency_map):
+        packed = b"".join(_ASCII_FREQ.pack(ord(char), count) for char, count in frequency_map.items())
+        return {"character_frequency_map": None, "character_frequency_ascii": packed}
+    return {"character_frequency_map": dict(frequency_map), "character_frequency_ascii": None}
+
+
+def unpack_frequency_map(packed, fallback):
+    """Decode the packed ASCII frequencies, or return the JSON fallback"""
+    if packed is None:
+        return fallback
+    return {chr(code): count for code, count in _ASCII_FREQ.iter_unpack(packed)}
+
+
+def row_to_dict(row):
+    """Convert a column mapping from a Core select to an API response dictionary"""
+    return {
+        "id": row["id"],
+        "value": row["value"],
+        "properties": {
+            "length": row["length"],
+            "is_palindrome": row["is_palindrome"],
+            "unique_characters": row["unique_characters"],
+            "word_count": row["word_count"],
+            "sha256_hash": row["sha256_hash"],
+            "character_frequency_map": unpack_frequency_map(
+                row["character_frequency_ascii"], row["character_frequency_map"]
+            )
+        },
+        "created_at": row["created_at"]
+    }
\ No newline at end of file
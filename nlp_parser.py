@@ -1,7 +1,20 @@
+import functools
 import re
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-def parse_natural_language_query(query: str) -> Dict:
+# All patterns fused into one alternation so the query is scanned once.
+# The letter is captured in a lookahead so it is not consumed and cannot
+# hide a following phrase (e.g. "contain at least 5").
+_RE_FILTERS = re.compile(
+    r'longer than (?P<longer>\d+)'
+    r'|shorter than (?P<shorter>\d+)'
+    r'|at least (?P<at_least>\d+)'
+    r'|at most (?P<at_most>\d+)'
+    r'|contain(?:ing)?(?: the)?(?: letter)? (?=(?P<letter>[a-z]))'
+)
+
+def _parse_natural_language_query_impl(query: str) -> Mapping:
     """
     Parse a natural language query into filter parameters.
     
@@ -15,7 +28,7 @@ def parse_natural_language_query(query: str) -> Dict:
         query: Natural language query string
         
     Returns:
-        Dictionary of parsed filters
+        Read-only mapping of parsed filters
     """
     query_lower = query.lower()
     filters = {}
@@ -33,32 +46,32 @@ def parse_natural_language_query(query: str) -> Dict:
     if "palindrom" in query_lower:
         filters["is_palindrome"] = True
     
+    # Keep the first match of each pattern
+    matches = {}
+    for match in _RE_FILTERS.finditer(query_lower):
+        matches.setdefault(match.lastgroup, match.group(match.lastgroup))
+    
     # Parse length constraints
     # "longer than X" → min_length=X+1
-    longer_than = re.search(r'longer than (\d+)', query_lower)
-    if longer_than:
-        filters["min_length"] = int(longer_than.group(1)) + 1
+    if "longer" in matches:
+        filters["min_length"] = int(matches["longer"]) + 1
     
     # "shorter than X" → max_length=X-1
-    shorter_than = re.search(r'shorter than (\d+)', query_lower)
-    if shorter_than:
-        filters["max_length"] = int(shorter_than.group(1)) - 1
+    if "shorter" in matches:
+        filters["max_length"] = int(matches["shorter"]) - 1
     
     # "at least X characters" → min_length=X
-    at_least = re.search(r'at least (\d+)', query_lower)
-    if at_least:
-        filters["min_length"] = int(at_least.group(1))
+    if "at_least" in matches:
+        filters["min_length"] = int(matches["at_least"])
     
     # "at most X characters" → max_length=X
-    at_most = re.search(r'at most (\d+)', query_lower)
-    if at_most:
-        filters["max_length"] = int(at_most.group(1))
+    if "at_most" in matches:
+        filters["max_length"] = int(matches["at_most"])
     
     # Parse character containment
     # "containing the letter X" or "contain X"
-    letter_match = re.search(r'contain(?:ing)?(?: the)?(?: letter)? ([a-z])', query_lower)
-    if letter_match:
-        filters["contains_character"] = letter_match.group(1)
+    if "letter" in matches:
+        filters["contains_character"] = matches["letter"]
     
     # "first vowel" → 'a'
     if "first vowel" in query_lower:
@@ -68,15 +81,37 @@ def parse_natural_language_query(query: str) -> Dict:
     if "last vowel" in query_lower:
         filters["contains_character"] = "u"
     
-    return filters
+    return MappingProxyType(filters)
+
+
+# Parsing is a pure function of the query, so repeated queries reuse the
+# cached result. Only short queries are memoized so the cache cannot pin
+# large inputs in memory.
+_MEMO_MAX_LENGTH = 256
+_parse_cached = functools.lru_cache(maxsize=1024)(_parse_natural_language_query_impl)
+
+
+def parse_natural_language_query(query: str) -> Mapping:
+    """
+    Parse a natural language query, reusing cached results for short queries.
+    
+    Args:
+        query: Natural language query string
+        
+    Returns:
+        Read-only mapping of parsed filters
+    """
+    if len(query) <= _MEMO_MAX_LENGTH:
+        return _parse_cached(query)
+    return _parse_natural_language_query_impl(query)
 
 
-def validate_parsed_filters(filters: Dict) -> Optional[str]:
+def validate_parsed_filters(filters: Mapping) -> Optional[str]:
     """
     Validate that parsed filters don't conflict.
     
     Args:
-        filters: Dictionary of filters
+        filters: Mapping of filters
         
     Returns:
         Error message if conflicting, None if valid
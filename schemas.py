@@ -8,7 +8,8 @@ class StringInput(BaseModel):
     
     @validator('value')
     def value_must_not_be_empty(cls, v):
-        if not v or not v.strip():
+        # isspace() scans in place and stops at the first non-whitespace char
+        if not v or v.isspace():
             raise ValueError('value cannot be empty')
         return v
 
@@ -26,14 +27,23 @@ class StringResponse(BaseModel):
     id: str
     value: str
     properties: StringProperties
-    created_at: str
+    created_at: datetime
 
 class StringListResponse(BaseModel):
     """Response schema for list of strings"""
     data: List[StringResponse]
     count: int
+    page_size: int
+    limit: int
+    offset: int
     filters_applied: Optional[Dict] = None
 
+class StringBatchResponse(BaseModel):
+    """Response schema for batch string creation"""
+    data: List[StringResponse]
+    count: int
+    skipped: List[str]
+
 class NaturalLanguageResponse(BaseModel):
     """Response for natural language queries"""
     data: List[StringResponse]